@@ -8,46 +8,84 @@ import sys
 # Add src to path if needed (though running as module is better)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.scrapers import western_cape, gauteng, mpumalanga
+from src.scrapers import western_cape, gauteng, mpumalanga, ScrapeError
+from src.utils.dates import job_closing_date
+from src.utils import schedule as poll_schedule
 
 # Configuration
 DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL")
 DAILY_SUMMARY = os.environ.get("DAILY_SUMMARY") == "true"
 
+# Seen entries are dropped this many days after their closing date
+CLOSING_GRACE_DAYS = 14
+# Entries without a known closing date are dropped after this many days
+UNDATED_MAX_AGE_DAYS = 180
+
 PROVINCE_CONFIG = {
     'western_cape': {
         'scraper': western_cape,
         'name': 'Western Cape Health',
         'state_file': 'data/state/western_cape_seen.json',
+        'schedule_file': 'data/state/western_cape_schedule.json',
         'color': 3066993, # Green-ish
     },
     'gauteng': {
         'scraper': gauteng,
         'name': 'Gauteng Health',
         'state_file': 'data/state/gauteng_seen.json',
+        'schedule_file': 'data/state/gauteng_schedule.json',
         'color': 128, # Navy Blue
     },
     'mpumalanga': {
         'scraper': mpumalanga,
         'name': 'Mpumalanga Health',
         'state_file': 'data/state/mpumalanga_seen.json',
+        'schedule_file': 'data/state/mpumalanga_schedule.json',
         'color': 15844367, # Gold/Yellow
     }
 }
 
-def load_seen_jobs(filepath):
-    """Loads the list of previously seen job identifiers."""
-    if os.path.exists(filepath):
-        with open(filepath, "r") as f:
-            return set(json.load(f))
-    return set()
+def load_seen_jobs(filepath, today=None):
+    """Loads previously seen job identifiers mapped to their expiry info."""
+    if not os.path.exists(filepath):
+        return {}
+    with open(filepath, "r") as f:
+        data = json.load(f)
+
+    if isinstance(data, list):
+        # Legacy format: a plain list of IDs. Treat them as first seen today
+        # and write the converted map back so the date sticks.
+        today = (today or poll_schedule.utc_now().date()).isoformat()
+        data = {job_id: {"first_seen": today, "closing_date": None} for job_id in data}
+        save_seen_jobs(filepath, data)
+    return data
 
 def save_seen_jobs(filepath, seen_jobs):
-    """Saves the updated list of seen job identifiers."""
+    """Saves the updated map of seen job identifiers."""
     # Ensure dir exists
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     with open(filepath, "w") as f:
-        json.dump(list(seen_jobs), f, indent=2)
+        json.dump(seen_jobs, f, indent=2, sort_keys=True)
+
+def expire_seen_jobs(seen_jobs, listed_ids, today=None):
+    """Drops seen entries that are no longer listed and are past their expiry."""
+    today = today or poll_schedule.utc_now().date()
+    expired = []
+    for job_id, info in seen_jobs.items():
+        if job_id in listed_ids:
+            continue
+        closing_date = info.get("closing_date")
+        if closing_date:
+            expires = datetime.date.fromisoformat(closing_date) + datetime.timedelta(days=CLOSING_GRACE_DAYS)
+        else:
+            first_seen = datetime.date.fromisoformat(info.get("first_seen") or today.isoformat())
+            expires = first_seen + datetime.timedelta(days=UNDATED_MAX_AGE_DAYS)
+        if today > expires:
+            expired.append(job_id)
+
+    for job_id in expired:
+        del seen_jobs[job_id]
+    return expired
 
 def send_new_jobs_summary(new_jobs, config):
     """Sends a summary of new jobs to Discord."""
@@ -131,23 +169,49 @@ def send_daily_summary(job_count, config):
 def main():
     parser = argparse.ArgumentParser(description="Run Job Alerts")
     parser.add_argument("--province", required=True, choices=['western_cape', 'gauteng', 'mpumalanga'], help="Province to scrape")
+    parser.add_argument("--force", action="store_true", help="Poll even if the province is not due yet")
     args = parser.parse_args()
 
     config = PROVINCE_CONFIG[args.province]
     print(f"Starting Alert Manager for {config['name']}...")
 
+    # 0. Check Polling Schedule
+    # One UTC clock for the due check, weekday buckets and state dates
+    now = poll_schedule.utc_now()
+    has_schedule = os.path.exists(config['schedule_file'])
+    schedule = poll_schedule.load_schedule(config['schedule_file'])
+    interval = poll_schedule.poll_interval(schedule, now)
+    if not (args.force or DAILY_SUMMARY or poll_schedule.is_due(schedule, now)):
+        print(f"Not due in this slot (interval {interval}h). Skipping.")
+        return
+    print(f"Polling (interval {interval}h).")
+
     # 1. Load State
-    seen_ids = load_seen_jobs(config['state_file'])
+    seen_ids = load_seen_jobs(config['state_file'], now.date())
     print(f"Loaded {len(seen_ids)} previously seen jobs.")
+    # On a cold start every listed job looks new, which says nothing about cadence
+    count_postings = has_schedule and bool(seen_ids)
 
     # 2. Run Scraper
     print("Running scraper...")
     # Pass seen_ids to allow scrapers to skip existing jobs
-    current_jobs = config['scraper'].run()
+    try:
+        if args.province == 'gauteng':
+            # Only open detail pages for jobs we have not seen; the listing
+            # still carries the closing date for known ones
+            current_jobs = config['scraper'].run(seen_ids)
+        else:
+            current_jobs = config['scraper'].run()
+    except ScrapeError as e:
+        # Leave state and schedule untouched so a failure is not read as "no vacancies"
+        print(f"Scrape failed: {e}")
+        return
     print(f"Scraper returned {len(current_jobs)} jobs.")
 
     new_jobs_count = 0
     new_jobs_found = []
+    listed_ids = set()
+    state_changed = False
 
     # 3. Process Jobs
     for job in current_jobs:
@@ -168,24 +232,44 @@ def main():
              # Last resort
              job_id = str(job)
 
+        listed_ids.add(job_id)
+        closing_date = job_closing_date(job)
+        closing_date = closing_date.isoformat() if closing_date else None
+
         if job_id not in seen_ids:
             new_jobs_count += 1
             print(f"New Job Found: {job_id}")
             new_jobs_found.append(job)
-            seen_ids.add(job_id)
+            seen_ids[job_id] = {
+                "first_seen": now.date().isoformat(),
+                "closing_date": closing_date,
+            }
+        elif closing_date and seen_ids[job_id].get("closing_date") != closing_date:
+            # Backfill or update closing dates for jobs we already know about
+            seen_ids[job_id]["closing_date"] = closing_date
+            state_changed = True
             
     # 4. Send Summary Alert
     if new_jobs_found:
         send_new_jobs_summary(new_jobs_found, config)
 
-    # 4. Save State
-    if new_jobs_count > 0:
+    # 5. Expire Old Entries
+    expired = expire_seen_jobs(seen_ids, listed_ids, now.date())
+    if expired:
+        print(f"Expired {len(expired)} closed jobs from seen list.")
+
+    # 6. Save State
+    if new_jobs_count > 0 or expired or state_changed:
         save_seen_jobs(config['state_file'], seen_ids)
+    if new_jobs_count > 0:
         print(f"Updated seen jobs list. {new_jobs_count} new jobs added.")
     else:
         print("No new jobs found.")
 
-    # 5. Daily Summary
+    poll_schedule.record_poll(schedule, len(current_jobs), new_jobs_count, count_postings, now)
+    poll_schedule.save_schedule(config['schedule_file'], schedule)
+
+    # 7. Daily Summary
     if DAILY_SUMMARY:
         send_daily_summary(len(current_jobs), config)
 
@@ -0,0 +1,47 @@
+try:
+    from lxml import html as lxml_html
+except ImportError as e:
+    raise ImportError("Re-parsing needs lxml: pip install -r requirements.txt") from e
+
+# Elements that start a new line in rendered text, roughly as inner_text() does
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+    'table', 'tbody', 'thead', 'tfoot', 'tr', 'ul',
+}
+CELL_TAGS = {'td', 'th'}
+HIDDEN_TAGS = ('script', 'style', 'noscript', 'template')
+
+def parse_html(html):
+    """Parses a page and drops elements that never render as text."""
+    tree = lxml_html.fromstring(html)
+    for elem in tree.xpath("|".join(f"//{tag}" for tag in HIDDEN_TAGS)):
+        elem.drop_tree()
+    return tree
+
+def text_of(elem):
+    """Approximates Playwright's inner_text(): visible text with line breaks between blocks."""
+    parts = []
+
+    def walk(node):
+        # Comments and processing instructions have a non-string tag
+        if not isinstance(node.tag, str):
+            return
+        tag = node.tag.lower()
+        if tag in BLOCK_TAGS or tag == 'br':
+            parts.append("\n")
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if tag in BLOCK_TAGS:
+            parts.append("\n")
+        elif tag in CELL_TAGS:
+            parts.append("\t")
+
+    walk(elem)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
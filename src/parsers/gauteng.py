@@ -0,0 +1,57 @@
+from src.parsers import parse_html, text_of
+
+# Mirrors the selectors used by src.scrapers.gauteng.scrape_details
+DETAIL_FIELDS = {
+    'title': 'body_lblDesc',
+    'reference_number': 'body_lblRefNo',
+    'directorate': 'body_lblDirectorate',
+    'centre': 'body_lblCentre',
+    'package_detail': 'body_lblPackage',
+    'closing_date_detail': 'body_lblClosingDate',
+    'enquiries': 'body_lblEnquiries',
+    'requirements': 'body_lblRequirements',
+    'duties': 'body_lblDuties',
+    'notes': 'body_lblNotes'
+}
+
+def job_key(job, entry):
+    """Listing rows and detail pages are joined on the detail page link."""
+    if job.get('link'):
+        return job['link']
+    if entry['kind'] == 'detail':
+        return entry['url']
+    # Rows without a link cannot be joined; keep them apart per page and position
+    return f"{entry['sha256']}:{job.get('position')}"
+
+def parse_listing(html, url):
+    """Extracts job summaries from an archived listing page."""
+    tree = parse_html(html)
+    jobs = []
+    for row in tree.xpath("//table[@id='tblJobs']/tbody/tr"):
+        cols = row.xpath("./td")
+        if len(cols) < 5:
+            continue
+
+        job_summary = {
+            "position": text_of(cols[0]),
+            "location": text_of(cols[1]),
+            "package": text_of(cols[2]),
+            "closing_date": text_of(cols[3]),
+        }
+
+        hrefs = row.xpath(".//a[starts-with(@href, 'ViewJob.aspx')]/@href")
+        job_summary['link'] = "https://jobs.gauteng.gov.za/Public/" + hrefs[0] if hrefs else None
+        jobs.append(job_summary)
+    return jobs
+
+def parse_detail(html, url):
+    """Extracts job details from an archived detail page."""
+    tree = parse_html(html)
+    details = {}
+    for key, elem_id in DETAIL_FIELDS.items():
+        found = tree.xpath(f"//*[@id='{elem_id}']")
+        details[key] = text_of(found[0]) if found else ""
+
+    form = tree.xpath("//form[@id='form1']") or tree.xpath("//body")
+    details['full_text'] = text_of(form[0]) if form else ""
+    return details
@@ -0,0 +1,45 @@
+from src.parsers import parse_html
+
+BASE_URL = "https://ehr.mpuhealth.gov.za/OnlineApp/Advert.aspx"
+
+def job_key(job, entry):
+    return job.get('reference_number') or entry['sha256']
+
+def parse_listing(html, url):
+    """Applies the same status heuristics as src.scrapers.mpumalanga.run."""
+    tree = parse_html(html)
+    jobs = []
+
+    # Heuristic 1: Check the specific "No Vacancies" box
+    found = tree.xpath("//*[@id='TextBox1']")
+    if found:
+        elem = found[0]
+        text_val = elem.get("value") if elem.tag == "input" else elem.text_content()
+        text_val = (text_val or "").strip()
+        if "No Vacancies advertised" in text_val:
+            return []
+
+        jobs.append({
+            "reference_number": "MPU-STATUS-CHANGE",
+            "title": "Mpumalanga Site Status Change",
+            "location": "Mpumalanga Online Portal",
+            "link": BASE_URL,
+            "description": f"The 'No Vacancies' text has changed to: {text_val}"
+        })
+
+    # Heuristic 2: Check for any "View" or "Apply" links. Like Playwright's
+    # a:text(), match case-insensitively against the link's full text.
+    lowered = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    links = tree.xpath(f"//a[contains({lowered}, 'view') or contains({lowered}, 'apply')]")
+    if links:
+        jobs.append({
+            "reference_number": "MPU-POSSIBLE-JOBS",
+            "title": "Possible Jobs Detected (Links Found)",
+            "location": "Mpumalanga Online Portal",
+            "link": BASE_URL,
+            "description": f"Found {len(links)} buttons/links that might be job listings."
+        })
+    return jobs
+
+def parse_detail(html, url):
+    return {}
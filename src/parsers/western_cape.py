@@ -0,0 +1,30 @@
+from src.parsers import parse_html, text_of
+
+# Mirrors the selectors used by src.scrapers.western_cape.scrape_vacancy_details
+DETAIL_FIELDS = {
+    'reference_number': 'lblReferenceNumber',
+    'title': 'lblPost',
+    'location': 'lblCentre',
+    'closing_date': 'lblClosingDate',
+}
+
+def job_key(job, entry):
+    """Detail pages are opened by postback and share one url, so fall back to the page hash."""
+    return job.get('reference_number') or entry['sha256']
+
+def parse_listing(html, url):
+    """Listing pages only hold postback buttons; jobs come from detail pages."""
+    return []
+
+def parse_detail(html, url):
+    """Extracts job details from an archived vacancy details page."""
+    tree = parse_html(html)
+    details = {'job_url': url}
+    for key, id_part in DETAIL_FIELDS.items():
+        found = tree.xpath(f"//span[contains(@id, '{id_part}')]")
+        if found:
+            details[key] = text_of(found[0])
+
+    main_content = tree.xpath("//div[@id='MainContent_pnlVacancyDetails']") or tree.xpath("//form")
+    details['full_text'] = text_of(main_content[0]) if main_content else ""
+    return details
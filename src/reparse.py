@@ -0,0 +1,104 @@
+import json
+import os
+import argparse
+import datetime
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Add src to path if needed (though running as module is better)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parsers import western_cape, gauteng, mpumalanga
+from src.utils import archive
+
+PARSERS = {
+    'western_cape': western_cape,
+    'gauteng': gauteng,
+    'mpumalanga': mpumalanga,
+}
+
+def parse_entry(entry):
+    """Re-extracts one archived page. Runs inside a worker process."""
+    parser = PARSERS[entry['province']]
+    try:
+        html = archive.read_page(entry['sha256'], entry['archive_dir'])
+        if entry['kind'] == 'listing':
+            return entry, parser.parse_listing(html, entry['url']), None
+        return entry, parser.parse_detail(html, entry['url']), None
+    except Exception as e:
+        return entry, None, str(e)
+
+def load_entries(archive_dirs):
+    """Merges the indexes of several archives, e.g. downloaded workflow artifacts.
+
+    A page stored in more than one archive is kept once, with its earliest
+    fetch time, and is read from the first archive that has it.
+    """
+    merged = {}
+    for archive_dir in archive_dirs:
+        for entry in archive.load_index(archive_dir):
+            key = (entry['sha256'], entry['url'])
+            entry['archive_dir'] = archive_dir
+            if key not in merged:
+                merged[key] = entry
+            elif entry['fetched_at'] < merged[key]['fetched_at']:
+                merged[key]['fetched_at'] = entry['fetched_at']
+    return list(merged.values())
+
+def select_entries(entries, province, since=None):
+    """Filters index entries to a province, oldest first."""
+    selected = [
+        entry for entry in entries
+        if entry['province'] == province and not (since and entry['fetched_at'] < since)
+    ]
+    return sorted(selected, key=lambda e: e['fetched_at'])
+
+def merge_results(results):
+    """Combines listing summaries with detail pages into job records."""
+    jobs = {}
+    for entry, parsed, _ in results:
+        parser = PARSERS[entry['province']]
+        # Results are in fetch order, so later pages override earlier ones
+        if entry['kind'] == 'listing':
+            for job in parsed:
+                jobs.setdefault(parser.job_key(job, entry), {}).update(job)
+        elif parsed:
+            jobs.setdefault(parser.job_key(parsed, entry), {}).update(parsed)
+    return list(jobs.values())
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract jobs from the raw page archive")
+    parser.add_argument("--province", required=True, choices=list(PARSERS), help="Province to re-parse")
+    parser.add_argument("--since", help="Only use pages first archived on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of parser processes")
+    parser.add_argument("--archive-dir", action="append", dest="archive_dirs", help="Archive location (repeat to merge several archives)")
+    parser.add_argument("--output", help="Output JSON path (defaults to a timestamped data directory)")
+    args = parser.parse_args()
+
+    archive_dirs = args.archive_dirs or [archive.ARCHIVE_DIR]
+    entries = select_entries(load_entries(archive_dirs), args.province, args.since)
+    print(f"Re-parsing {len(entries)} archived pages with {args.workers} workers...")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # map() keeps input order, so results stay sorted by fetch time
+        chunksize = max(1, len(entries) // (args.workers * 4 or 1))
+        results = list(pool.map(parse_entry, entries, chunksize=chunksize))
+
+    failed = [(entry, error) for entry, _, error in results if error]
+    for entry, error in failed:
+        print(f"Error parsing {entry['url']} ({entry['sha256'][:12]}): {error}")
+
+    jobs = merge_results([r for r in results if not r[2]])
+
+    output_path = args.output
+    if not output_path:
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        output_path = os.path.join("data", timestamp, f"{args.province}_reparsed.json")
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(jobs, f, indent=2, default=str)
+
+    print(f"Done. Extracted {len(jobs)} jobs ({len(failed)} pages failed). Saved to {output_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+class ScrapeError(Exception):
+    """Raised when a site could not be scraped, as opposed to listing no vacancies."""
@@ -1,9 +1,16 @@
 import json
 import time
 import os
+import sys
 import datetime
 from playwright.sync_api import sync_playwright
 
+# Add repo root to path so the scraper can also be run directly
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers import ScrapeError
+from src.utils.archive import archive_page
+
 BASE_URL = "https://jobs.gauteng.gov.za/Public/DepartmentJobs.aspx?dept=6"
 
 def scrape_details(browser, link):
@@ -12,6 +19,7 @@ def scrape_details(browser, link):
     details = {}
     try:
         page.goto(link, timeout=60000)
+        archive_page(page, link, 'gauteng', 'detail')
         
         # Robust Selectors based on ID attributes
         selectors = {
@@ -74,15 +82,13 @@ def run(seen_ids=None):
         try:
             page.goto(BASE_URL, timeout=60000)
         except Exception as e:
-             print(f"Error navigating: {e}")
-             return []
+             raise ScrapeError(f"Error navigating: {e}") from e
         
         # Wait for table to load
         try:
             page.wait_for_selector("table#tblJobs", timeout=30000)
-        except:
-            print("Job table not found.")
-            return []
+        except Exception as e:
+            raise ScrapeError("Job table not found.") from e
 
         page_num = 1
         
@@ -96,6 +102,8 @@ def run(seen_ids=None):
             
             if count == 0:
                 break
+
+            archive_page(page, f"{BASE_URL}#page={page_num}", 'gauteng', 'listing')
             
             # Iterate over rows
             # Note: We extract data first to minimize interacting with the page loop
@@ -1,8 +1,15 @@
 from playwright.sync_api import sync_playwright
 import datetime
 import os
+import sys
 import json
 
+# Add repo root to path so the scraper can also be run directly
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers import ScrapeError
+from src.utils.archive import archive_page
+
 BASE_URL = "https://ehr.mpuhealth.gov.za/OnlineApp/Advert.aspx"
 
 def run():
@@ -20,6 +27,7 @@ def run():
         try:
             page.goto(BASE_URL, timeout=60000)
             page.wait_for_load_state("networkidle")
+            archive_page(page, BASE_URL, 'mpumalanga', 'listing')
             
             # Heuristic 1: Check the specific "No Vacancies" box
             try:
@@ -59,7 +67,7 @@ def run():
                 })
 
         except Exception as e:
-            print(f"Error scraping Mpumalanga: {e}")
+            raise ScrapeError(f"Error scraping Mpumalanga: {e}") from e
         finally:
             browser.close()
             
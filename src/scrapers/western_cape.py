@@ -1,15 +1,23 @@
 import json
 import time
 import os
+import sys
 import datetime
 from playwright.sync_api import sync_playwright
 
+# Add repo root to path so the scraper can also be run directly
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers import ScrapeError
+from src.utils.archive import archive_page
+
 BASE_URL = "https://www.scubedonline.co.za/recruitment_wcdh/vacancy-posting.aspx"
 
 def scrape_vacancy_details(page):
     """Scrapes details from the current vacancy details page."""
     details = {}
     details['job_url'] = page.url
+    archive_page(page, page.url, 'western_cape', 'detail')
     try:
         # Example: Reference Number
         ref_elem = page.locator("span[id*='lblReferenceNumber']")
@@ -26,6 +34,11 @@ def scrape_vacancy_details(page):
         if loc_elem.count() > 0:
             details['location'] = loc_elem.first.inner_text().strip()
 
+        # Closing Date
+        closing_elem = page.locator("span[id*='lblClosingDate']")
+        if closing_elem.count() > 0:
+            details['closing_date'] = closing_elem.first.inner_text().strip()
+
         # Generic full text
         main_content = page.locator("div#MainContent_pnlVacancyDetails")
         if main_content.count() > 0:
@@ -78,8 +91,7 @@ def run():
         try:
             page.goto(BASE_URL, timeout=60000)
         except Exception as e:
-            print(f"Error navigating: {e}")
-            return []
+            raise ScrapeError(f"Error navigating: {e}") from e
         
         page_num = 1
         
@@ -117,6 +129,8 @@ def run():
                     print("No jobs to scrape.")
                     break
                 elif not grid_found:
+                    if page_num == 1:
+                        raise ScrapeError("Grid not found after retries.")
                     print("Grid not found after retries.")
                     break
 
@@ -129,6 +143,8 @@ def run():
                 if buttons_count == 0:
                     break
 
+                archive_page(page, f"{BASE_URL}#page={page_num}", 'western_cape', 'listing')
+
                 for i in range(buttons_count):
                     # Robust re-locate
                     button = page.locator("input[value='Vacancy Details']").nth(i)
@@ -0,0 +1,92 @@
+import json
+import os
+import re
+import gzip
+import hashlib
+import datetime
+
+# Opt-in: scrapers only store raw pages when this is enabled
+ARCHIVE_PAGES = os.environ.get("ARCHIVE_PAGES") == "true"
+ARCHIVE_DIR = os.environ.get("ARCHIVE_DIR", os.path.join("data", "archive"))
+
+# ASP.NET state fields change on every load and would defeat deduplication
+VOLATILE_INPUTS = re.compile(
+    r'(<input[^>]*name="__(?:VIEWSTATE|VIEWSTATEGENERATOR|EVENTVALIDATION)"[^>]*value=")[^"]*(")',
+    re.IGNORECASE,
+)
+
+_index_keys = None
+
+def normalise_html(html):
+    """Blanks out per-request state so identical pages hash identically."""
+    return VOLATILE_INPUTS.sub(r"\1\2", html)
+
+def object_path(digest, archive_dir=None):
+    """Returns the path of an archived page for a given content hash."""
+    archive_dir = archive_dir or ARCHIVE_DIR
+    return os.path.join(archive_dir, "objects", digest[:2], f"{digest}.html.gz")
+
+def index_path(archive_dir=None):
+    return os.path.join(archive_dir or ARCHIVE_DIR, "index.jsonl")
+
+def load_index(archive_dir=None):
+    """Loads all index entries describing archived pages."""
+    path = index_path(archive_dir)
+    entries = []
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+    return entries
+
+def read_page(digest, archive_dir=None):
+    """Reads an archived page back as text."""
+    with gzip.open(object_path(digest, archive_dir), "rt", encoding="utf-8") as f:
+        return f.read()
+
+def archive_page(page, url, province, kind):
+    """Stores the raw HTML of a Playwright page, deduplicated by content hash.
+
+    The page is only serialised when archiving is enabled, and any error is
+    contained here so it never affects the scrape itself. Returns the
+    content hash, or None if archiving is disabled or fails.
+    """
+    global _index_keys
+    if not ARCHIVE_PAGES:
+        return None
+
+    try:
+        html = page.content()
+        if not html:
+            return None
+        html = normalise_html(html)
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+        path = object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                f.write(html)
+
+        # Only index each (page, url) pair once
+        if _index_keys is None:
+            _index_keys = {(e["sha256"], e["url"]) for e in load_index()}
+        if (digest, url) in _index_keys:
+            return digest
+
+        entry = {
+            "sha256": digest,
+            "url": url,
+            "province": province,
+            "kind": kind,
+            "fetched_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(index_path(), "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        _index_keys.add((digest, url))
+        return digest
+    except Exception as e:
+        print(f"Error archiving page {url}: {e}")
+        return None
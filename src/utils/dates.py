@@ -0,0 +1,49 @@
+import re
+import datetime
+
+# Patterns are tried in order; each maps a regex to the strptime formats
+# used to interpret the normalised match. Day-first is preferred for
+# numeric dates as that is what the South African portals use.
+DATE_PATTERNS = [
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), ["%Y-%m-%d"]),
+    (re.compile(r"\d{1,2}-\d{1,2}-\d{4}"), ["%d-%m-%Y", "%m-%d-%Y"]),
+    (re.compile(r"\d{1,2}-[A-Za-z]{3,9}-\d{4}"), ["%d-%b-%Y", "%d-%B-%Y"]),
+    (re.compile(r"\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}"), ["%d %B %Y", "%d %b %Y"]),
+    (re.compile(r"[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4}"), ["%B %d %Y", "%b %d %Y"]),
+]
+
+def parse_closing_date(text):
+    """Parses a closing date out of free text, returning a date or None."""
+    if not text:
+        return None
+
+    # Normalise separators and ordinals ("31st", "2025/01/31", "31.01.2025")
+    cleaned = re.sub(r"(\d)(st|nd|rd|th)\b", r"\1", str(text), flags=re.IGNORECASE)
+    cleaned = re.sub(r"(?<=\d)[/.](?=\d)", "-", cleaned)
+    # strptime only knows "Sep" and "September"
+    cleaned = re.sub(r"\bSept\b\.?", "Sep", cleaned, flags=re.IGNORECASE)
+
+    for pattern, formats in DATE_PATTERNS:
+        for match in pattern.finditer(cleaned):
+            candidate = re.sub(r"[,\s]+", " ", match.group(0)).strip()
+            for fmt in formats:
+                try:
+                    return datetime.datetime.strptime(candidate, fmt).date()
+                except ValueError:
+                    continue
+    return None
+
+def job_closing_date(job):
+    """Returns the parsed closing date for a scraped job, if one is available."""
+    unparsed = []
+    for key in ('closing_date_detail', 'closing_date'):
+        value = job.get(key)
+        parsed = parse_closing_date(value)
+        if parsed:
+            return parsed
+        if value and str(value).strip():
+            unparsed.append(str(value).strip())
+
+    if unparsed:
+        print(f"Warning: could not parse closing date {unparsed[0]!r}; using undated expiry.")
+    return None
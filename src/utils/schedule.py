@@ -0,0 +1,110 @@
+import json
+import os
+import math
+import datetime
+
+# Polling bounds in hours. The workflow cron fires every MIN_INTERVAL_HOURS
+# and each province decides for itself whether the current slot is due.
+# All intervals are multiples of MIN_INTERVAL_HOURS.
+MIN_INTERVAL_HOURS = 2
+BASE_INTERVAL_HOURS = 6
+QUIET_INTERVAL_HOURS = 12
+MAX_INTERVAL_HOURS = 48
+MAX_EMPTY_STREAK = 3 # 6h * 2**3 already exceeds MAX_INTERVAL_HOURS
+
+# Only postings from the last few weeks shape the weekday cadence
+POSTING_WINDOW_WEEKS = 8
+# Number of postings needed before weekday cadence is trusted
+MIN_OBSERVED_POSTINGS = 10
+
+def utc_now():
+    """The single clock used for scheduling, so cron slots, weekdays and dates agree."""
+    return datetime.datetime.now(datetime.timezone.utc)
+
+def load_schedule(filepath):
+    """Loads the polling history for a province."""
+    schedule = {
+        "empty_streak": 0,
+        "postings_by_date": {},
+    }
+    if os.path.exists(filepath):
+        with open(filepath, "r") as f:
+            schedule.update(json.load(f))
+    return schedule
+
+def save_schedule(filepath, schedule):
+    """Saves the polling history for a province."""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, "w") as f:
+        json.dump(schedule, f, indent=2, sort_keys=True)
+
+def postings_by_weekday(schedule, today=None):
+    """Sums new postings per weekday over the recent window."""
+    today = today or utc_now().date()
+    cutoff = today - datetime.timedelta(weeks=POSTING_WINDOW_WEEKS)
+    postings = [0] * 7
+    for day, count in schedule.get("postings_by_date", {}).items():
+        day = datetime.date.fromisoformat(day)
+        if day > cutoff:
+            postings[day.weekday()] += count
+    return postings
+
+def poll_interval(schedule, now=None):
+    """Picks the polling interval (in hours) from the observed posting cadence."""
+    now = now or utc_now()
+
+    # Back off exponentially while the site reports no vacancies at all
+    streak = schedule.get("empty_streak", 0)
+    if streak > 0:
+        return min(BASE_INTERVAL_HOURS * 2 ** streak, MAX_INTERVAL_HOURS)
+
+    postings = postings_by_weekday(schedule, now.date())
+    total = sum(postings)
+    if total < MIN_OBSERVED_POSTINGS:
+        return BASE_INTERVAL_HOURS
+
+    today = postings[now.weekday()]
+    if today == 0:
+        return QUIET_INTERVAL_HOURS
+    if today >= total / 7:
+        return MIN_INTERVAL_HOURS
+    return BASE_INTERVAL_HOURS
+
+def is_due(schedule, now=None):
+    """Returns True if the current cron slot falls on the province's interval.
+
+    Slots are counted in hours since the epoch, rounded down to a multiple of
+    MIN_INTERVAL_HOURS. Scheduled runs start late but never early, so a
+    delayed run still counts towards the slot it was scheduled for, as long
+    as it starts before the next cron run. This keeps the schedule free of
+    per-run timestamps.
+    """
+    now = now or utc_now()
+    hours = now.timestamp() / 3600
+    slot = math.floor(hours / MIN_INTERVAL_HOURS) * MIN_INTERVAL_HOURS
+    # Judge the interval at the scheduled time, not the delayed start
+    slot_time = datetime.datetime.fromtimestamp(slot * 3600, datetime.timezone.utc)
+    return slot % poll_interval(schedule, slot_time) == 0
+
+def record_poll(schedule, job_count, new_job_count, count_postings=True, now=None):
+    """Updates the polling history after a successful scrape.
+
+    count_postings should be False on a cold start, where every listed job
+    looks new and would skew the weekday cadence.
+    """
+    today = (now or utc_now()).date()
+    if job_count == 0:
+        schedule["empty_streak"] = min(schedule.get("empty_streak", 0) + 1, MAX_EMPTY_STREAK)
+    else:
+        schedule["empty_streak"] = 0
+
+    cutoff = today - datetime.timedelta(weeks=POSTING_WINDOW_WEEKS)
+    postings = {
+        day: count for day, count in schedule.get("postings_by_date", {}).items()
+        if datetime.date.fromisoformat(day) > cutoff
+    }
+    if new_job_count and count_postings:
+        key = today.isoformat()
+        postings[key] = postings.get(key, 0) + new_job_count
+    schedule["postings_by_date"] = postings
+    return schedule